@@ -2,6 +2,7 @@ import os
 import requests
 from dotenv import load_dotenv
 from fastmcp import FastMCP
+from read_cache import cached_read, invalidates
 
 # ---------------- ENV ----------------
 load_dotenv()
@@ -50,6 +51,7 @@ def get_all_sources() -> dict:
     return airbyte_get("/sources")
 
 @mcp.tool()
+@cached_read(ttl=30, tags=("airbyte:sources",))
 def get_info_source(source_id: str) -> dict:
     """Get info about a specific source"""
     return airbyte_get(f"/sources/{source_id}")
@@ -60,11 +62,13 @@ def list_all_connections() -> dict:
     return airbyte_get("/connections")
 
 @mcp.tool()
+@cached_read(ttl=30, tags=("airbyte:connections",))
 def get_connection_info(connection_id: str) -> dict:
     """Get info about a specific connection"""
     return airbyte_get(f"/connections/{connection_id}")
 
 @mcp.tool()
+@invalidates("airbyte:connections")
 def create_connection_blob(source_id: str, destination_id: str = "735f737a-118e-464b-b1bd-96dfafb5460b") -> dict:
     """Create connection from Blob storage to destination"""
     payload = {
@@ -77,6 +81,7 @@ def create_connection_blob(source_id: str, destination_id: str = "735f737a-118e-
     return airbyte_post("/connections", payload)
 
 @mcp.tool()
+@invalidates("airbyte:connections")
 def sync_job(connection_id: str) -> dict:
     """Trigger sync for a connection"""
     payload = {"jobType": "sync", "connectionId": connection_id}
@@ -0,0 +1,521 @@
+"""
+Offline benchmark for the MCP servers in this repo.
+
+Every upstream (Airbyte, Fivetran, Confluence, GitHub, Azure Blob) is replaced
+by a local fake HTTP server with configurable latency and page size, and each
+server's tools are driven in-process with the fastmcp `Client` at a configurable
+concurrency. Postgres is benchmarked only when BENCH_POSTGRES_DSN points at a
+reachable database.
+
+Read caches (read_cache.py) are disabled by default, so cached tools make one
+upstream request per call and stay comparable with pre-cache baselines; pass
+--read-cache to measure with caching and coalescing on.
+
+Usage:
+    python bench.py --requests 200 --concurrency 16 --latency-ms 20 -o baseline.json
+    python bench.py --compare baseline.json
+"""
+import argparse
+import asyncio
+import base64
+import contextlib
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+from fastmcp import Client
+
+import read_cache
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+BLOB_ACCOUNT = "devstoreaccount1"
+
+
+# ---------------- FAKE UPSTREAMS ----------------
+class FakeUpstream:
+    """
+    Local HTTP server that answers through `route(method, path, query, body)`.
+
+    `route` returns (status, content_type, payload); dict/list payloads are sent
+    as JSON. Each request sleeps `latency` seconds before answering.
+    """
+
+    def __init__(self, name: str, route, latency: float = 0.0):
+        self.name = name
+        self.route = route
+        self.latency = latency
+        self.hits = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeUpstream":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self):
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self):
+                with upstream._lock:
+                    upstream.hits += 1
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                parsed = urlparse(self.path)
+                query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+                if upstream.latency:
+                    time.sleep(upstream.latency)
+                status, content_type, payload = upstream.route(self.command, parsed.path, query, body)
+                if not isinstance(payload, (bytes, str)):
+                    payload = json.dumps(payload)
+                data = payload.encode() if isinstance(payload, str) else payload
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.send_header("x-ms-version", "2021-08-06")
+                self.send_header("x-ms-request-id", "bench")
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PATCH = _serve
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def _json(payload, status: int = 200):
+    return status, "application/json", payload
+
+
+def _not_found():
+    return _json({"message": "not found"}, 404)
+
+
+def airbyte_routes(page_size: int):
+    def route(method, path, query, body):
+        if path == "/v1/applications/token":
+            return _json({"access_token": "bench-token", "token_type": "Bearer", "expires_in": 180})
+        if path in ("/v1/sources", "/v1/connections"):
+            if method == "POST":
+                return _json({"connectionId": "conn-new", "status": "active"})
+            kind = path.rsplit("/", 1)[-1]
+            offset = int(query.get("offset", 0))
+            data = [{"id": f"{kind}-{offset + i}", "name": f"{kind} {offset + i}"} for i in range(page_size)]
+            return _json({"data": data, "next": f"{path}?offset={offset + page_size}"})
+        if path.startswith(("/v1/sources/", "/v1/connections/")):
+            return _json({"id": path.rsplit("/", 1)[-1], "name": "bench", "status": "active"})
+        if path == "/v1/jobs" and method == "POST":
+            return _json({"jobId": 1, "status": "running", "jobType": "sync"})
+        return _not_found()
+
+    return route
+
+
+def fivetran_routes(page_size: int):
+    def route(method, path, query, body):
+        if path == "/v1/connectors":
+            if method == "POST":
+                return _json({"code": "Success", "data": {"id": "connector_new"}})
+            cursor = int(query.get("cursor", 0))
+            items = [{"id": f"connector_{cursor + i}", "schema": f"schema_{cursor + i}"} for i in range(page_size)]
+            return _json({"code": "Success", "data": {"items": items, "next_cursor": str(cursor + page_size)}})
+        if path.endswith("/sync") and method == "POST":
+            return _json({"code": "Success", "message": "Sync has been successfully triggered"})
+        if path.startswith("/v1/connectors/"):
+            connector_id = path.rsplit("/", 1)[-1]
+            return _json({"code": "Success", "data": {"id": connector_id, "service": "azure_postgres",
+                                                      "status": {"setup_state": "connected"}}})
+        return _not_found()
+
+    return route
+
+
+def confluence_routes(page_size: int):
+    def route(method, path, query, body):
+        if path == "/wiki/rest/api/content" and method == "POST":
+            return _json({"id": "1001", "type": "page", "status": "current"})
+        if path.startswith("/wiki/rest/api/content/"):
+            page_id = path.rsplit("/", 1)[-1]
+            value = "<p>" + "lorem ipsum " * 100 + "</p>"
+            return _json({"id": page_id, "body": {"storage": {"value": value, "representation": "storage"}}})
+        if path == "/wiki/rest/api/space":
+            limit = min(int(query.get("limit", page_size)), page_size)
+            start = int(query.get("start", 0))
+            results = [{"key": f"SP{start + i}", "name": f"Space {start + i}"} for i in range(limit)]
+            return _json({"results": results, "start": start, "limit": limit, "size": len(results),
+                          "_links": {"next": f"/rest/api/space?start={start + limit}&limit={limit}"}})
+        return _not_found()
+
+    return route
+
+
+def github_routes(page_size: int):
+    def route(method, path, query, body):
+        parts = path.strip("/").split("/")
+        if parts[0] == "users" and len(parts) == 2:
+            return _json({"login": parts[1], "id": 1, "public_repos": 42})
+        if parts[0] == "repos" and len(parts) >= 4:
+            if parts[3] == "pulls" and len(parts) == 4:
+                if method == "POST":
+                    return _json({"number": 1, "state": "open"}, 201)
+                prs = [{"number": i, "title": f"PR {i}", "state": query.get("state", "open"),
+                        "user": {"login": "bench"}} for i in range(page_size)]
+                return _json(prs)
+            if method == "POST":
+                return _json({"id": 1, "body": "ok"}, 201)
+        return _not_found()
+
+    return route
+
+
+def blob_routes(page_size: int, pages: int):
+    def route(method, path, query, body):
+        parts = path.strip("/").split("/")
+        if len(parts) != 2 or query.get("comp") != "list":
+            return 404, "application/xml", "<Error><Code>ResourceNotFound</Code></Error>"
+        container = parts[1]
+        start = int(query.get("marker") or 0)
+        end = start + page_size
+        blobs = "".join(
+            f"<Blob><Name>file_{i:06d}.csv</Name><Properties><Content-Length>1024</Content-Length>"
+            f"<BlobType>BlockBlob</BlobType></Properties></Blob>"
+            for i in range(start, end)
+        )
+        next_marker = str(end) if end < page_size * pages else ""
+        xml = (
+            '<?xml version="1.0" encoding="utf-8"?>'
+            f'<EnumerationResults ServiceEndpoint="http://127.0.0.1/{BLOB_ACCOUNT}" ContainerName="{container}">'
+            f"<MaxResults>{page_size}</MaxResults><Blobs>{blobs}</Blobs><NextMarker>{next_marker}</NextMarker>"
+            "</EnumerationResults>"
+        )
+        return 200, "application/xml", xml
+
+    return route
+
+
+# ---------------- SERVER SETUP ----------------
+def load_server(path: str):
+    """
+    Load a server script by path and return the module (its FastMCP app is `module.mcp`).
+
+    Servers are loaded under a `bench_` name so `azure.py` is not confused with
+    the `azure` SDK package (see `_import_azure_sdk`).
+    """
+    _import_azure_sdk()
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(f"bench_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _load_server(module_name: str):
+    """Load one of this repo's servers so it picks up the fake environment."""
+    return load_server(os.path.join(REPO_DIR, f"{module_name}.py"))
+
+
+def _import_azure_sdk():
+    """
+    Import the `azure` SDK namespace package before any server is loaded.
+
+    While the repo directory is on sys.path, `azure.py` shadows the SDK; once the
+    SDK is in sys.modules, `from azure.storage.blob import ...` resolves to it.
+    """
+    saved = sys.path[:]
+    sys.path[:] = [p for p in saved if os.path.abspath(p or os.curdir) != REPO_DIR]
+    try:
+        importlib.import_module("azure.storage.blob")
+    except ImportError:
+        pass
+    finally:
+        sys.path[:] = saved
+    if REPO_DIR not in sys.path:
+        sys.path.append(REPO_DIR)
+
+
+def setup_airbyte(upstreams):
+    os.environ["AIRBYTE_CLIENT_ID"] = "bench"
+    os.environ["AIRBYTE_CLIENT_SECRET"] = "bench"
+    module = _load_server("airbyte")
+    module.BASE_URL = f"{upstreams['airbyte'].url}/v1"
+    return module.mcp, [
+        ("get_all_sources", {}),
+        ("get_info_source", {"source_id": "src-1"}),
+        ("list_all_connections", {}),
+        ("get_connection_info", {"connection_id": "conn-1"}),
+        ("create_connection_blob", {"source_id": "src-1"}),
+        ("sync_job", {"connection_id": "conn-1"}),
+    ]
+
+
+def _set_fivetran_env():
+    os.environ["FIVETRAN_API_KEY"] = "bench"
+    os.environ["FIVETRAN_API_SECRET"] = "bench"
+
+
+def setup_my_server(upstreams):
+    _set_fivetran_env()
+    module = _load_server("my_server")
+    module.BASE_URL = f"{upstreams['fivetran'].url}/v1/connectors"
+    return module.mcp, [
+        ("get_connector_info", {"connector_id": "connector_1"}),
+    ]
+
+
+def setup_postgres_fivetran(upstreams):
+    _set_fivetran_env()
+    module = _load_server("postgres_fivetran")
+    module.BASE_URL = f"{upstreams['fivetran'].url}/v1/connectors"
+    return module.mcp, [
+        ("create_connection_for_postgress", {"connection_name": "bench", "host": "db.local", "port": 5432,
+                                             "database": "postgres", "user": "bench", "password": "bench"}),
+        ("get_all_connections", {}),
+        ("get_connector_info", {"connector_id": "connector_1"}),
+        ("sync_connection", {"connector_id": "connector_1"}),
+    ]
+
+
+def setup_confluence(upstreams):
+    os.environ["CONFLUENCE_BASE_URL"] = f"{upstreams['confluence'].url}/wiki"
+    os.environ["CONFLUENCE_USER"] = "bench@example.com"
+    os.environ["CONFLUENCE_TOKEN"] = "bench"
+    os.environ["CONFLUENCE_SPACE_KEY"] = "BENCH"
+    module = _load_server("confluence_mcp")
+    return module.mcp, [
+        ("summarize_page", {"page_id": "12345"}),
+        ("navigate_spaces", {"limit": 25}),
+        ("create_page", {"body": "benchmark conversation"}),
+    ]
+
+
+def setup_github(upstreams):
+    os.environ["GITHUB_TOKEN"] = "bench"
+    module = _load_server("github")
+    module.BASE_URL = upstreams["github"].url
+    return module.mcp, [
+        ("list_pull_requests", {"owner": "octo", "repo": "bench"}),
+        ("create_pull_request", {"owner": "octo", "repo": "bench", "title": "t", "head": "feature", "base": "main"}),
+        ("comment_on_pull_request", {"owner": "octo", "repo": "bench", "pr_number": 1, "body": "lgtm"}),
+        ("review_pull_request", {"owner": "octo", "repo": "bench", "pr_number": 1, "body": "lgtm"}),
+        ("resource:github://octocat", {}),
+    ]
+
+
+def setup_azure(upstreams):
+    account_key = base64.b64encode(b"bench-account-key").decode()
+    os.environ["AZURE_STORAGE_CONNECTION_STRING"] = (
+        f"DefaultEndpointsProtocol=http;AccountName={BLOB_ACCOUNT};AccountKey={account_key};"
+        f"BlobEndpoint={upstreams['blob'].url}/{BLOB_ACCOUNT};"
+    )
+    module = _load_server("azure")
+    return module.mcp, [
+        ("list_all_files_in_blob", {"container_name": "bench"}),
+    ]
+
+
+def setup_postgres(upstreams):
+    dsn = os.getenv("BENCH_POSTGRES_DSN")
+    if not dsn:
+        return None
+    import psycopg2
+
+    try:
+        psycopg2.connect(dsn).close()
+    except psycopg2.OperationalError as exc:
+        print(f"Skipping postgres: {exc}".strip(), file=sys.stderr)
+        return None
+    _set_fivetran_env()
+    module = _load_server("postgres")
+    # The tool hardcodes its connection settings; route it to the local database instead.
+    module.psycopg2 = SimpleNamespace(connect=lambda **kwargs: psycopg2.connect(dsn))
+    return module.mcp, [
+        ("get_postgres_dml", {"schema_name": os.getenv("BENCH_POSTGRES_SCHEMA", "public")}),
+    ]
+
+
+SERVERS = {
+    "airbyte": setup_airbyte,
+    "my_server": setup_my_server,
+    "postgres_fivetran": setup_postgres_fivetran,
+    "confluence_mcp": setup_confluence,
+    "github": setup_github,
+    "azure": setup_azure,
+    "postgres": setup_postgres,
+}
+
+
+# ---------------- MEASUREMENT ----------------
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of `samples` (0 for an empty list)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    """Aggregate per-call latencies (seconds) into the baseline report fields."""
+    calls = len(latencies) + errors
+    return {
+        "calls": calls,
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "rps": round(calls / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+async def _invoke(client: Client, tool: str, args: dict):
+    if tool.startswith("resource:"):
+        return await client.read_resource(tool.split(":", 1)[1])
+    return await client.call_tool(tool, args)
+
+
+async def bench_tool(mcp, tool: str, args: dict, requests: int, concurrency: int) -> dict:
+    """Issue `requests` calls to one tool from `concurrency` concurrent client sessions."""
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        async with Client(mcp) as client:
+            for _ in remaining:
+                start = time.perf_counter()
+                try:
+                    await _invoke(client, tool, args)
+                except Exception:
+                    errors += 1
+                else:
+                    latencies.append(time.perf_counter() - start)
+
+    # Warm up once so import/initialization cost is not counted.
+    async with Client(mcp) as client:
+        try:
+            await _invoke(client, tool, args)
+        except Exception as exc:
+            print(f"  warm-up failed for {tool}: {exc}", file=sys.stderr)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+    return summarize(latencies, errors, time.perf_counter() - start)
+
+
+async def run_benchmarks(opts) -> dict:
+    read_cache.set_enabled(opts.read_cache)
+    latency = opts.latency_ms / 1000
+    upstreams = {
+        "airbyte": FakeUpstream("airbyte", airbyte_routes(opts.page_size), latency),
+        "fivetran": FakeUpstream("fivetran", fivetran_routes(opts.page_size), latency),
+        "confluence": FakeUpstream("confluence", confluence_routes(opts.page_size), latency),
+        "github": FakeUpstream("github", github_routes(opts.page_size), latency),
+        "blob": FakeUpstream("blob", blob_routes(opts.page_size, opts.pages), latency),
+    }
+    for upstream in upstreams.values():
+        upstream.start()
+
+    results = {}
+    try:
+        for name in opts.servers:
+            try:
+                setup = SERVERS[name](upstreams)
+            except ImportError as exc:
+                print(f"Skipping {name}: {exc}", file=sys.stderr)
+                continue
+            if setup is None:
+                continue
+            mcp, tools = setup
+            for tool, args in tools:
+                if opts.tools and tool not in opts.tools:
+                    continue
+                print(f"{name}.{tool} ...", file=sys.stderr)
+                results[f"{name}.{tool}"] = await bench_tool(mcp, tool, args, opts.requests, opts.concurrency)
+    finally:
+        for upstream in upstreams.values():
+            upstream.stop()
+
+    return {
+        "config": {
+            "requests": opts.requests,
+            "concurrency": opts.concurrency,
+            "latency_ms": opts.latency_ms,
+            "page_size": opts.page_size,
+            "pages": opts.pages,
+            "read_cache": "enabled" if opts.read_cache else "disabled",
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict) -> str:
+    """Render a per-tool p50/p99/rps delta table against a previous report."""
+    lines = [f"{'tool':<55} {'p50 ms':>16} {'p99 ms':>16} {'rps':>16}"]
+    for key, now in current["results"].items():
+        before = baseline.get("results", {}).get(key)
+        cells = []
+        for field in ("p50_ms", "p99_ms", "rps"):
+            if before is None or not before[field]:
+                cells.append(f"{now[field]:>16}")
+            else:
+                change = (now[field] - before[field]) / before[field] * 100
+                cells.append(f"{now[field]:>9} ({change:+.0f}%)".rjust(16))
+        lines.append(f"{key:<55} " + " ".join(cells))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the MCP servers against local fake upstreams.")
+    parser.add_argument("--servers", nargs="+", choices=sorted(SERVERS), default=list(SERVERS),
+                        help="servers to benchmark (default: all)")
+    parser.add_argument("--tools", nargs="+", help="only benchmark these tool names")
+    parser.add_argument("--requests", type=int, default=100, help="calls per tool")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent client sessions per tool")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="added latency per upstream request")
+    parser.add_argument("--page-size", type=int, default=50, help="items per page in list responses")
+    parser.add_argument("--pages", type=int, default=4, help="pages served by paginated blob listings")
+    parser.add_argument("--read-cache", action="store_true",
+                        help="enable read caching and coalescing (default: every call goes upstream)")
+    parser.add_argument("-o", "--output", help="write the JSON report to this file")
+    parser.add_argument("--compare", help="previous JSON report to diff against")
+    opts = parser.parse_args(argv)
+
+    # Servers print debug output; keep stdout clean for the JSON report.
+    with contextlib.redirect_stdout(sys.stderr):
+        report = asyncio.run(run_benchmarks(opts))
+
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if opts.output:
+        with open(opts.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if opts.compare:
+        with open(opts.compare) as f:
+            print(compare(json.load(f), report), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import os
 import httpx
 from fastmcp import FastMCP
 from dotenv import load_dotenv
+from read_cache import cached_read
 
 load_dotenv()
 
@@ -139,6 +140,7 @@ def review_pull_request(owner: str, repo: str, pr_number: int, body: str, event:
 # ---------- Resource ----------
 
 @mcp.resource("github://{username}")
+@cached_read(ttl=60, tags=("github:users",), cache_if=lambda profile: "error" not in profile)
 def get_user_profile(username: str) -> dict:
     """Fetch a GitHub user profile"""
     url = f"{BASE_URL}/users/{username}"
@@ -3,6 +3,7 @@ import requests
 from dotenv import load_dotenv
 from requests.auth import HTTPBasicAuth
 from fastmcp import FastMCP
+from read_cache import cached_read
 
 # Load env vars
 load_dotenv()
@@ -22,6 +23,7 @@ mcp = FastMCP("My MCP Server")
 
 # ---------------- TOOLS ----------------
 @mcp.tool()
+@cached_read(ttl=30, tags=("fivetran:connectors",))
 def get_connector_info(connector_id: str) -> dict:
     """
     Retrieve metadata and status for a given Fivetran connector.
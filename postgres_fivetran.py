@@ -4,6 +4,7 @@ import requests
 from dotenv import load_dotenv
 from requests.auth import HTTPBasicAuth
 from fastmcp import FastMCP
+from read_cache import cached_read, invalidates
 
 # ─── Load environment variables ───────────────────────────────
 load_dotenv()
@@ -24,6 +25,7 @@ mcp = FastMCP("My MCP Server")
 # ---------------- TOOLS ----------------
 # ─── Fivetran Tools ──────────────────────────────────────────
 @mcp.tool()
+@invalidates("fivetran:connectors")
 def create_connection_for_postgress(connection_name, host, port, database, user, password):
     """
     Create a Fivetran PostgreSQL connector.
@@ -84,6 +86,7 @@ def get_all_connections():
 
 
 @mcp.tool()
+@cached_read(ttl=30, tags=("fivetran:connectors",))
 def get_connector_info(connector_id: str) -> dict:
     """
     Retrieve metadata for a specific Fivetran connector.
@@ -101,6 +104,7 @@ def get_connector_info(connector_id: str) -> dict:
 
 
 @mcp.tool()
+@invalidates("fivetran:connectors")
 def sync_connection(connector_id):
     """
     Trigger an immediate data sync for a Fivetran connector.
@@ -0,0 +1,210 @@
+"""
+Shared response cache for idempotent read tools.
+
+`cached_read` wraps a read-only tool so that identical concurrent calls share
+one upstream request (single-flight) and results are kept in a TTL + LRU cache
+bounded by entry count and approximate size. Mutating tools declare what they
+make stale with `invalidates`, or call `invalidate` directly.
+
+    @mcp.tool()
+    @cached_read(ttl=30, tags=("fivetran:connectors",))
+    def get_connector_info(connector_id: str) -> dict: ...
+
+    @mcp.tool()
+    @invalidates("fivetran:connectors")
+    def sync_connection(connector_id): ...
+
+The wrapped tool becomes `async`: callers waiting on an in-flight call await it
+on the event loop, and only the one caller doing the upstream request takes a
+worker thread, so a burst of identical calls cannot exhaust fastmcp's thread
+pool. The upstream call is owned by the cache, so cancelling one caller (a client
+cancelling or disconnecting) never cancels the others waiting on it. Cached
+results are shared between callers and must not be mutated.
+"""
+import asyncio
+import functools
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+import anyio
+
+_enabled = True
+_caches = []
+_caches_by_tag = defaultdict(list)
+_registry_lock = threading.Lock()
+
+
+def _consume_exception(task: asyncio.Task):
+    """Mark a load's error retrieved so a load whose callers all left does not log it."""
+    if not task.cancelled():
+        task.exception()
+
+
+class ReadCache:
+    """
+    TTL + LRU cache with single-flight loading.
+
+    `get_or_load` must run on the event loop; `clear` may be called from any thread.
+
+    Args:
+        ttl (float): Seconds an entry stays fresh.
+        maxsize (int): Maximum number of entries.
+        max_bytes (int): Maximum total size of entries, measured as their JSON length.
+    """
+
+    def __init__(self, ttl: float, maxsize: int, max_bytes: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._entries = OrderedDict()  # key -> (expires_at, size, value)
+        self._bytes = 0
+        self._inflight = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    async def get_or_load(self, key: str, load, cache_if=None):
+        """Return the cached value for `key`, joining or starting a threaded upstream `load()` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[2]
+                self._evict(key)
+            generation = self._generation
+
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = self._inflight[key] = asyncio.get_running_loop().create_task(
+                self._load(key, load, cache_if, generation))
+            flight.add_done_callback(_consume_exception)
+            self.misses += 1
+        else:
+            self.coalesced += 1
+        # The load belongs to the cache, not to whichever caller started it;
+        # a cancelled caller stops waiting without cancelling anyone else.
+        return await asyncio.shield(flight)
+
+    async def _load(self, key: str, load, cache_if, generation: int):
+        try:
+            result = await anyio.to_thread.run_sync(load)
+        finally:
+            del self._inflight[key]
+        with self._lock:
+            # Skip storing if an invalidation fired while the call was in flight.
+            if generation == self._generation and (cache_if is None or cache_if(result)):
+                self._store(key, result)
+        return result
+
+    def clear(self):
+        """Drop every entry and discard results of calls still in flight."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._generation += 1
+
+    def _store(self, key: str, value):
+        try:
+            size = len(json.dumps(value, default=str))
+        except (TypeError, ValueError):
+            return
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, size, value)
+        self._bytes += size
+        while len(self._entries) > self.maxsize or self._bytes > self.max_bytes:
+            self._evict(next(iter(self._entries)))
+
+    def _evict(self, key: str):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+def cached_read(ttl: float = 30.0, maxsize: int = 256, max_bytes: int = 4_000_000, tags=(), cache_if=None):
+    """
+    Decorator for idempotent sync read tools: coalesce identical in-flight calls and cache results.
+
+    The returned wrapper is a coroutine function that runs `func` in a worker thread.
+
+    Args:
+        ttl (float): Seconds a result stays fresh.
+        maxsize (int): Maximum number of cached argument combinations.
+        max_bytes (int): Approximate memory bound, measured as the JSON length of cached results.
+        tags (tuple[str]): Invalidation tags; `invalidate(tag)` clears this cache.
+        cache_if (callable): Optional predicate; results for which it returns False are not cached.
+    """
+    def decorator(func):
+        cache = ReadCache(ttl, maxsize, max_bytes)
+        signature = inspect.signature(func)
+        with _registry_lock:
+            _caches.append(cache)
+            for tag in tags:
+                _caches_by_tag[tag].append(cache)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not _enabled:
+                return await anyio.to_thread.run_sync(functools.partial(func, *args, **kwargs))
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = json.dumps(bound.arguments, sort_keys=True, default=repr)
+            return await cache.get_or_load(key, functools.partial(func, *args, **kwargs), cache_if)
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+def set_enabled(enabled: bool):
+    """Turn caching and coalescing on or off for every `cached_read` tool (e.g. to benchmark upstream calls)."""
+    global _enabled
+    _enabled = enabled
+
+
+def invalidate(*tags: str):
+    """Clear every cache registered under any of `tags`."""
+    with _registry_lock:
+        caches = [cache for tag in tags for cache in _caches_by_tag.get(tag, ())]
+    for cache in caches:
+        cache.clear()
+
+
+def invalidate_all():
+    """Clear every registered cache."""
+    with _registry_lock:
+        caches = list(_caches)
+    for cache in caches:
+        cache.clear()
+
+
+def invalidates(*tags: str):
+    """Decorator for sync or async mutating tools: fire `invalidate(*tags)` after each call, even if it raised."""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    invalidate(*tags)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            finally:
+                invalidate(*tags)
+
+        return wrapper
+
+    return decorator
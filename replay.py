@@ -0,0 +1,174 @@
+"""
+Replay a JSONL log of MCP tool calls against any server.
+
+Each input line is a JSON object with the tool `name`, its `args` (or
+`arguments`) and an optional `timestamp` (epoch seconds or ISO 8601). Calls are
+replayed with their original spacing (scaled by --speed) or at a fixed --rate,
+spread round-robin over N client sessions that each multiplex many in-flight
+calls. One JSONL result line per call is streamed to --output as calls finish.
+
+The target is an MCP URL or a server script from this repo; scripts are loaded
+in-process and all sessions share the one FastMCP app.
+
+Usage:
+    python replay.py requests.jsonl --target http://localhost:8000/mcp --sessions 8 -o results.jsonl
+    python replay.py requests.jsonl --target airbyte.py --rate 50
+"""
+import argparse
+import asyncio
+import contextlib
+import datetime
+import json
+import sys
+import time
+from collections import defaultdict
+
+from fastmcp import Client
+
+from bench import load_server, summarize
+
+
+def _parse_timestamp(value) -> float | None:
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    return datetime.datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+
+
+def load_calls(path: str) -> list[dict]:
+    """Read a JSONL call log into a list of {"name", "args", "timestamp"} dicts."""
+    calls = []
+    with open(path) as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "name" not in record:
+                raise ValueError(f"{path}:{lineno}: missing tool 'name'")
+            calls.append({
+                "name": record["name"],
+                "args": record.get("args", record.get("arguments")) or {},
+                "timestamp": _parse_timestamp(record.get("timestamp")),
+            })
+    return calls
+
+
+def schedule(calls: list[dict], rate: float | None = None, speed: float = 1.0) -> list[float]:
+    """
+    Return the start offset (seconds from replay start) for each call.
+
+    With `rate`, calls are evenly spaced at that many calls per second. Otherwise
+    the recorded timestamps are kept, measured from the earliest one and divided
+    by `speed`, so unsorted logs (e.g. merged from several agents) keep their
+    spacing; `replay` dispatches in offset order. Calls without a timestamp start
+    together with the previous call in the log.
+    """
+    if rate is not None:
+        return [i / rate for i in range(len(calls))]
+    timestamps = [c["timestamp"] for c in calls if c["timestamp"] is not None]
+    origin = min(timestamps, default=0.0)
+    offsets = []
+    last = 0.0
+    for call in calls:
+        if call["timestamp"] is not None:
+            last = (call["timestamp"] - origin) / speed
+        offsets.append(last)
+    return offsets
+
+
+async def replay(calls: list[dict], target, sessions: int, offsets: list[float],
+                 output, max_inflight: int = 0, timeout: float | None = None) -> dict:
+    """
+    Replay `calls` against `target`, write one result line per call, and return per-tool stats.
+
+    `target` is anything `Client` accepts (an MCP URL or a FastMCP app). Calls are
+    dispatched in offset order; `seq` in the output is the call's position in the log.
+    """
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    limit = asyncio.Semaphore(max_inflight) if max_inflight else contextlib.nullcontext()
+
+    async with contextlib.AsyncExitStack() as stack:
+        clients = [await stack.enter_async_context(Client(target, timeout=timeout)) for _ in range(sessions)]
+
+        async def run(seq: int, call: dict, scheduled: float):
+            session = seq % len(clients)
+            async with limit:
+                started = time.perf_counter()
+                error = None
+                try:
+                    await clients[session].call_tool(call["name"], call["args"])
+                except Exception as exc:
+                    error = f"{type(exc).__name__}: {exc}"
+                latency = time.perf_counter() - started
+
+            if error is None:
+                latencies[call["name"]].append(latency)
+            else:
+                errors[call["name"]] += 1
+            output.write(json.dumps({
+                "seq": seq,
+                "name": call["name"],
+                "session": session,
+                "scheduled_ms": round(scheduled * 1000, 3),
+                "lag_ms": round((started - begin - scheduled) * 1000, 3),
+                "latency_ms": round(latency * 1000, 3),
+                "ok": error is None,
+                "error": error,
+            }) + "\n")
+            output.flush()
+
+        tasks = []
+        begin = time.perf_counter()
+        for seq in sorted(range(len(calls)), key=offsets.__getitem__):
+            call, scheduled = calls[seq], offsets[seq]
+            delay = scheduled - (time.perf_counter() - begin)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(run(seq, call, scheduled)))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - begin
+
+    return {
+        name: summarize(latencies[name], errors[name], elapsed)
+        for name in sorted(set(latencies) | set(errors))
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a JSONL log of MCP tool calls against a server.")
+    parser.add_argument("log", help="JSONL file of {name, args, timestamp} records")
+    parser.add_argument("--target", required=True,
+                        help="server to call: an MCP URL (http://host:8000/mcp) or a server script (airbyte.py), "
+                             "loaded in-process")
+    parser.add_argument("--sessions", type=int, default=1, help="concurrent client sessions")
+    parser.add_argument("--rate", type=float, help="fixed calls per second instead of the recorded timing")
+    parser.add_argument("--speed", type=float, default=1.0, help="speed-up factor for the recorded timing")
+    parser.add_argument("--max-inflight", type=int, default=0, help="cap on concurrent calls (0 = no cap)")
+    parser.add_argument("--timeout", type=float, help="per-call timeout in seconds")
+    parser.add_argument("-o", "--output", help="write per-call results here (default: stdout)")
+    opts = parser.parse_args(argv)
+
+    if opts.sessions < 1:
+        parser.error("--sessions must be at least 1")
+    if opts.speed <= 0:
+        parser.error("--speed must be positive")
+    if opts.rate is not None and opts.rate <= 0:
+        parser.error("--rate must be positive")
+
+    target = opts.target
+    if not target.startswith(("http://", "https://")):
+        target = load_server(target).mcp
+
+    calls = load_calls(opts.log)
+    offsets = schedule(calls, rate=opts.rate, speed=opts.speed)
+    with open(opts.output, "w") if opts.output else contextlib.nullcontext(sys.stdout) as output, \
+            contextlib.redirect_stdout(sys.stderr):  # in-process servers print debug output
+        stats = asyncio.run(replay(calls, target, opts.sessions, offsets, output,
+                                   max_inflight=opts.max_inflight, timeout=opts.timeout))
+    print(json.dumps(stats, indent=2, sort_keys=True), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+import asyncio
+import inspect
+import threading
+import time
+
+import anyio
+import pytest
+
+import read_cache
+from read_cache import cached_read, invalidate, invalidate_all, invalidates
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_concurrent_identical_calls_share_one_upstream_call():
+    calls = []
+
+    @cached_read()
+    def read(x: int):
+        calls.append(x)
+        time.sleep(0.05)
+        return {"x": x}
+
+    async def main():
+        return await asyncio.gather(*(read(1) for _ in range(20)))
+
+    results = run(main())
+    assert results == [{"x": 1}] * 20
+    assert calls == [1]
+    assert read.cache.misses == 1
+    assert read.cache.coalesced == 19
+
+
+def test_positional_keyword_and_default_arguments_share_a_key():
+    calls = []
+
+    @cached_read()
+    def read(x: int, y: int = 1):
+        calls.append((x, y))
+        return x + y
+
+    async def main():
+        await read(1)
+        await read(1, 1)
+        await read(x=1, y=1)
+        await read(1, y=2)
+
+    run(main())
+    assert calls == [(1, 1), (1, 2)]
+
+
+def test_lru_eviction_and_ttl_expiry():
+    calls = []
+
+    @cached_read(ttl=0.2, maxsize=2)
+    def read(x: int):
+        calls.append(x)
+        return x
+
+    async def main():
+        await read(1)
+        await read(2)
+        await read(1)  # hit; 2 is now least recently used
+        await read(3)  # evicts 2
+        await read(2)
+        assert calls == [1, 2, 3, 2]
+        await asyncio.sleep(0.25)
+        await read(2)
+
+    run(main())
+    assert calls == [1, 2, 3, 2, 2]
+
+
+def test_results_over_the_byte_bound_are_not_cached():
+    calls = []
+
+    @cached_read(max_bytes=10)
+    def read(size: int):
+        calls.append(size)
+        return "x" * size
+
+    async def main():
+        await read(100)
+        await read(100)
+        await read(2)
+        await read(2)
+
+    run(main())
+    assert calls == [100, 100, 2]
+
+
+def test_errors_reach_every_waiter_and_are_not_cached():
+    calls = []
+
+    @cached_read()
+    def read():
+        calls.append(1)
+        time.sleep(0.05)
+        raise ValueError("upstream down")
+
+    async def main():
+        return await asyncio.gather(*(read() for _ in range(5)), return_exceptions=True)
+
+    results = run(main())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert len(calls) == 1
+    with pytest.raises(ValueError):
+        run(read())
+    assert len(calls) == 2
+
+
+def test_cancelling_the_first_caller_does_not_cancel_the_others():
+    release = threading.Event()
+    calls = []
+
+    @cached_read()
+    def read():
+        calls.append(1)
+        release.wait(5)
+        return "ok"
+
+    async def main():
+        first = asyncio.create_task(read())
+        second = asyncio.create_task(read())
+        await asyncio.sleep(0.05)
+        first.cancel()
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(first, second, return_exceptions=True)
+
+    first, second = run(main())
+    assert isinstance(first, asyncio.CancelledError)
+    assert second == "ok"
+    assert calls == [1]
+    # The load finished for the remaining caller, so the result was cached.
+    assert run(read()) == "ok"
+    assert calls == [1]
+
+
+def test_invalidation_during_flight_discards_the_result():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    @cached_read(tags=("test:inflight",))
+    def read():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return len(calls)
+
+    async def main():
+        task = asyncio.create_task(read())
+        await anyio.to_thread.run_sync(started.wait)
+        invalidate("test:inflight")
+        release.set()
+        assert await task == 1
+        assert await read() == 2
+
+    run(main())
+
+
+def test_invalidates_fires_even_when_the_mutation_raises():
+    calls = []
+
+    @cached_read(tags=("test:mutate",))
+    def read():
+        calls.append(1)
+        return len(calls)
+
+    @invalidates("test:mutate")
+    def mutate():
+        raise RuntimeError("upstream rejected")
+
+    async def main():
+        await read()
+        with pytest.raises(RuntimeError):
+            mutate()
+        await read()
+
+    run(main())
+    assert calls == [1, 1]
+
+
+def test_invalidates_waits_for_async_mutations():
+    calls = []
+    seen_during_mutation = []
+
+    @cached_read(tags=("test:async-mutate",))
+    def read():
+        calls.append(1)
+        return len(calls)
+
+    @invalidates("test:async-mutate")
+    async def mutate():
+        await asyncio.sleep(0.01)
+        # Invalidation must not have fired yet, so this is still a cache hit.
+        seen_during_mutation.append(await read())
+
+    async def main():
+        assert await read() == 1
+        await mutate()
+        assert await read() == 2
+
+    assert inspect.iscoroutinefunction(mutate)
+    run(main())
+    assert seen_during_mutation == [1]
+
+
+def test_invalidate_all_clears_untagged_and_tagged_caches():
+    calls = []
+
+    @cached_read(tags=("test:all",))
+    def tagged():
+        calls.append("tagged")
+
+    @cached_read()
+    def untagged():
+        calls.append("untagged")
+
+    async def main():
+        await tagged()
+        await untagged()
+        invalidate_all()
+        await tagged()
+        await untagged()
+
+    run(main())
+    assert calls == ["tagged", "untagged"] * 2
+
+
+def test_disabled_caching_sends_every_call_upstream():
+    calls = []
+
+    @cached_read()
+    def read():
+        calls.append(1)
+        time.sleep(0.05)
+        return "ok"
+
+    async def main():
+        return await asyncio.gather(*(read() for _ in range(5)))
+
+    read_cache.set_enabled(False)
+    try:
+        assert run(main()) == ["ok"] * 5
+        assert run(read()) == "ok"
+    finally:
+        read_cache.set_enabled(True)
+    assert len(calls) == 6
+    assert read.cache.misses == 0
+
+
+def test_cache_if_skips_unwanted_results():
+    calls = []
+
+    @cached_read(cache_if=lambda profile: "error" not in profile)
+    def read():
+        calls.append(1)
+        return {"error": "rate limited"}
+
+    async def main():
+        await read()
+        await read()
+
+    run(main())
+    assert len(calls) == 2
+
+
+def test_waiters_do_not_hold_worker_threads():
+    release = threading.Event()
+    order = []
+
+    @cached_read()
+    def read():
+        release.wait(5)
+        order.append("read")
+        return "ok"
+
+    def other_tool():
+        order.append("other")
+        release.set()
+
+    async def main():
+        # A tiny pool: blocking waiters would starve `other_tool` until `read` timed out.
+        anyio.to_thread.current_default_thread_limiter().total_tokens = 2
+        readers = asyncio.gather(*(read() for _ in range(50)))
+        await asyncio.sleep(0.05)
+        await anyio.to_thread.run_sync(other_tool)
+        return await readers
+
+    assert run(main()) == ["ok"] * 50
+    assert order == ["other", "read"]
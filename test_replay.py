@@ -0,0 +1,52 @@
+import json
+
+from replay import load_calls, schedule
+
+
+def write_log(tmp_path, records):
+    path = tmp_path / "calls.jsonl"
+    path.write_text("\n".join(json.dumps(r) for r in records) + "\n\n")
+    return str(path)
+
+
+def test_load_calls_parses_iso_and_epoch_timestamps(tmp_path):
+    path = write_log(tmp_path, [
+        {"name": "a", "args": {"x": 1}, "timestamp": "2026-10-18T10:00:00Z"},
+        {"name": "b", "arguments": {"y": 2}, "timestamp": "2026-10-18T10:00:01.500000+00:00"},
+        {"name": "c", "timestamp": 1700000000},
+        {"name": "d"},
+    ])
+    calls = load_calls(path)
+    assert [c["name"] for c in calls] == ["a", "b", "c", "d"]
+    assert calls[0]["args"] == {"x": 1}
+    assert calls[1]["args"] == {"y": 2}
+    assert calls[2]["args"] == {}
+    assert calls[1]["timestamp"] - calls[0]["timestamp"] == 1.5
+    assert calls[2]["timestamp"] == 1700000000.0
+    assert calls[3]["timestamp"] is None
+
+
+def test_schedule_keeps_spacing_of_unsorted_logs():
+    calls = [{"timestamp": t} for t in (10, 5, 0, 12)]
+    assert schedule(calls) == [10.0, 5.0, 0.0, 12.0]
+    assert schedule(calls, speed=2) == [5.0, 2.5, 0.0, 6.0]
+
+
+def test_schedule_measures_from_the_earliest_iso_timestamp(tmp_path):
+    path = write_log(tmp_path, [
+        {"name": "a", "timestamp": "2026-10-18T10:00:02Z"},
+        {"name": "b", "timestamp": "2026-10-18T10:00:00Z"},
+        {"name": "c", "timestamp": "2026-10-18T10:00:01Z"},
+    ])
+    assert schedule(load_calls(path)) == [2.0, 0.0, 1.0]
+
+
+def test_schedule_starts_untimed_calls_with_the_previous_call():
+    calls = [{"timestamp": None}, {"timestamp": 3}, {"timestamp": None}, {"timestamp": 1}]
+    assert schedule(calls) == [0.0, 2.0, 2.0, 0.0]
+    assert schedule([{"timestamp": None}] * 3) == [0.0, 0.0, 0.0]
+
+
+def test_schedule_with_rate_ignores_timestamps():
+    calls = [{"timestamp": t} for t in (10, 5, 0, 12)]
+    assert schedule(calls, rate=4) == [0.0, 0.25, 0.5, 0.75]